@@ -1,16 +1,30 @@
 """Utils for aiohue."""
 
-import logging
-from dataclasses import MISSING, asdict, dataclass, fields, is_dataclass
+from collections.abc import Callable
+from dataclasses import MISSING, Field, dataclass, fields, is_dataclass, replace
 from datetime import datetime
 from enum import Enum
+from functools import cache, lru_cache
+import logging
+import sys
 from types import NoneType, UnionType
-from typing import Any, Union, get_args, get_origin, get_type_hints
+from typing import Any, ClassVar, Union, get_args, get_origin, get_type_hints
 
 from aiohttp import ClientSession
 
 from aiohue.errors import raise_from_error
 
+try:
+    # prefer the (much) faster orjson library for (de)serializing json, if installed
+    from orjson import dumps as _orjson_dumps, loads as json_loads
+
+    def json_dumps(obj: Any) -> str:
+        """Serialize obj to a json formatted str."""
+        return _orjson_dumps(obj).decode()
+
+except ImportError:
+    from json import dumps as json_dumps, loads as json_loads  # noqa: F401
+
 
 async def create_app_key(
     host: str, device_type: str, websession: ClientSession | None = None
@@ -79,49 +93,132 @@ def update_dataclass(cur_obj: dataclass, new_vals: dict) -> set[str]:
     """
     Update instance of dataclass from (partial) dict.
 
+    All values are parsed (and validated) before anything is changed,
+    so an invalid update leaves the instance untouched.
+    Derived (non-init) fields are skipped and recalculated by
+    calling `__post_init__` again (if any) when something changed.
+
     Returns: Set with changed keys.
     """
-    changed_keys = set()
-    for f in fields(cur_obj):
-        cur_val = getattr(cur_obj, f.name, None)
-        new_val = new_vals.get(f.name)
+    return _apply_update(cur_obj, _prepare_update(cur_obj, new_vals))
+
+
+# parsed (changed) values and updates of mutable sub models, per field name
+_UpdateType = tuple[dict[str, Any], dict[str, "_UpdateType"]]
+
+
+def _prepare_update(cur_obj: dataclass, new_vals: dict) -> _UpdateType:
+    """Parse the changed values of a (partial) update, without applying them."""
+    values = {}
+    sub_updates = {}
+    for name, full_name, parse_func, value_type, _ in _get_field_parsers(type(cur_obj)):
+        cur_val = getattr(cur_obj, name, None)
+        new_val = new_vals.get(name)
 
         # handle case where value is sub dataclass/model
         if is_dataclass(cur_val) and isinstance(new_val, dict):
-            for subkey in update_dataclass(cur_val, new_val):
-                changed_keys.add(f"{f.name}.{subkey}")
-            continue
-        # parse value from type annotations
-        new_val = _parse_value(f.name, new_val, f.type, cur_val)
-        if cur_val == new_val:
-            continue
-        setattr(cur_obj, f.name, new_val)
-        changed_keys.add(f.name)
+            if not cur_val.__dataclass_params__.frozen:
+                sub_update = _prepare_update(cur_val, new_val)
+                if sub_update[0] or sub_update[1]:
+                    sub_updates[name] = sub_update
+                continue
+            # immutable (frozen) sub model, replace it with an updated copy
+            new_val = _replace_dataclass(cur_val, new_val)
+        else:
+            # parse value from type annotations
+            new_val = parse_func(full_name, new_val, value_type, cur_val)
+        if cur_val != new_val:
+            values[name] = new_val
+    return values, sub_updates
+
+
+def _apply_update(cur_obj: dataclass, update: _UpdateType) -> set[str]:
+    """Apply a prepared update to a dataclass instance, return the changed keys."""
+    values, sub_updates = update
+    changed_keys = set()
+    for name, sub_update in sub_updates.items():
+        for subkey in _apply_update(getattr(cur_obj, name), sub_update):
+            changed_keys.add(f"{name}.{subkey}")
+    for name, new_val in values.items():
+        setattr(cur_obj, name, new_val)
+        changed_keys.add(name)
+    if changed_keys and hasattr(cur_obj, "__post_init__"):
+        cur_obj.__post_init__()
     return changed_keys
 
 
+def _replace_dataclass(cur_obj: dataclass, new_vals: dict) -> dataclass:
+    """Return a copy of an (immutable) dataclass instance, updated from (partial) dict."""
+    cls = type(cur_obj)
+    field_parsers = _get_field_parsers(cls)
+    if hasattr(cls, "from_dict") and all(x[0] in new_vals for x in field_parsers):
+        # complete object, prefer the class' own factory (e.g. shared identifiers)
+        return cls.from_dict(new_vals)
+    changes = {}
+    for name, full_name, parse_func, value_type, _ in field_parsers:
+        if name not in new_vals:
+            continue
+        cur_val = getattr(cur_obj, name)
+        new_val = new_vals[name]
+        if is_dataclass(cur_val) and isinstance(new_val, dict):
+            # nested (partial) sub model
+            changes[name] = _replace_dataclass(cur_val, new_val)
+        else:
+            changes[name] = parse_func(full_name, new_val, value_type, cur_val)
+    return replace(cur_obj, **changes)
+
+
 def dataclass_to_dict(obj_in: dataclass, skip_none: bool = True) -> dict:
-    """Convert dataclass instance to dict, optionally skip None values."""
-    if skip_none:
-        dict_obj = asdict(
-            obj_in, dict_factory=lambda x: {k: v for (k, v) in x if v is not None}
-        )
-    else:
-        dict_obj = asdict(obj_in)
+    """
+    Convert dataclass instance to dict, optionally skip None values.
+
+    Private (underscore prefixed) fields are never part of the api model
+    and are thus always skipped.
+    """
+    return {
+        name: _serialize_value(value, skip_none)
+        for name in _get_field_names(type(obj_in))
+        if (value := getattr(obj_in, name)) is not None or not skip_none
+    }
+
+
+@cache
+def _get_field_names(cls: dataclass) -> tuple[str, ...]:
+    """
+    Return the (cached) names of all public fields of a dataclass.
+
+    A resource `type` declared as ClassVar (constant for the model)
+    is included too, as it is part of the api model.
+    """
+    names = tuple(f.name for f in fields(cls) if not f.name.startswith("_"))
+    if "type" not in names and any(
+        get_origin(klass.__dict__.get("__annotations__", {}).get("type")) is ClassVar
+        for klass in cls.__mro__
+    ):
+        names += ("type",)
+    return names
+
+
+def _serialize_value(value: Any, skip_none: bool) -> Any:
+    """Convert a (model) value to its plain (json) representation."""
+    if is_dataclass(value):
+        return dataclass_to_dict(value, skip_none)
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, dict):
+        return {
+            key: _serialize_value(subvalue, skip_none)
+            for key, subvalue in value.items()
+            if subvalue is not None or not skip_none
+        }
+    if isinstance(value, list | tuple | set):
+        return type(value)(_serialize_value(subvalue, skip_none) for subvalue in value)
+    return value
 
-    def _clean_dict(_dict_obj: dict):
-        final = {}
-        for key, value in _dict_obj.items():
-            if value is None and skip_none:
-                continue
-            if isinstance(value, dict):
-                value = _clean_dict(value)  # noqa: PLW2901
-            if isinstance(value, Enum):
-                value = value.value  # noqa: PLW2901
-            final[key] = value
-        return final
 
-    return _clean_dict(dict_obj)
+def compact_repr(self) -> str:
+    """Return a compact representation of a resource (without the full state)."""
+    return f"{type(self).__name__}(id={self.id!r})"
 
 
 def parse_utc_timestamp(datetimestr: str):
@@ -129,6 +226,27 @@ def parse_utc_timestamp(datetimestr: str):
     return datetime.fromisoformat(datetimestr.replace("Z", "+00:00"))
 
 
+def parse_enum(enum_cls: type[Enum], value: Any) -> Enum:
+    """Return the Enum member for the given (raw) value."""
+    try:
+        # fast path: direct lookup in the value map of the Enum class,
+        # avoiding the (much slower) EnumMeta.__call__ for known values.
+        return enum_cls._value2member_map_[value]
+    except KeyError:
+        # unknown value, let the Enum class handle it, which will call
+        # `_missing_` to provide a default value (if any).
+        return _parse_unknown_enum(enum_cls, value)
+    except TypeError:
+        # unhashable value, only the Enum class itself can handle this
+        return enum_cls(value)
+
+
+@lru_cache(maxsize=256)
+def _parse_unknown_enum(enum_cls: type[Enum], value: Any) -> Enum:
+    """Return the (bounded, cached) `_missing_` default for an unknown Enum value."""
+    return enum_cls(value)
+
+
 def format_utc_timestamp(time: datetime):
     """Format datetime to string."""
     return time.strftime("%Y-%m-%dT%H:%M:%S.%fZ")
@@ -146,7 +264,7 @@ def _parse_value(name: str, value: Any, value_type: Any, default: Any = MISSING)
         # always prefer classes that have a from_dict
         return value_type.from_dict(value)
 
-    if value is None and not isinstance(default, type(MISSING)):
+    if value is None and default is not MISSING:
         return default
     if value is None and value_type is NoneType:
         return None
@@ -155,8 +273,19 @@ def _parse_value(name: str, value: Any, value_type: Any, default: Any = MISSING)
     # get origin value type and inspect one-by-one
     origin: Any = get_origin(value_type)
     if origin in (list, tuple, set) and isinstance(value, list | tuple | set):
+        # resolve the item type once, not for every item in the list
+        item_type = get_args(value_type)[0]
+        if is_dataclass(item_type) and not hasattr(item_type, "from_dict"):
+            # fast path for lists of models (e.g. scene actions)
+            return origin(
+                dataclass_from_dict(item_type, subvalue)
+                if isinstance(subvalue, dict)
+                else _parse_value(name, subvalue, item_type)
+                for subvalue in value
+                if subvalue is not None
+            )
         return origin(
-            _parse_value(name, subvalue, get_args(value_type)[0])
+            _parse_value(name, subvalue, item_type)
             for subvalue in value
             if subvalue is not None
         )
@@ -208,7 +337,7 @@ def _parse_value(name: str, value: Any, value_type: Any, default: Any = MISSING)
 
     try:
         if issubclass(value_type, Enum):
-            return value_type(value)
+            return parse_enum(value_type, value)
         if issubclass(value_type, datetime):
             return parse_utc_timestamp(value)
     except TypeError:
@@ -230,6 +359,65 @@ def _parse_value(name: str, value: Any, value_type: Any, default: Any = MISSING)
     return value
 
 
+# (identifier) fields that will be interned when parsed
+# the same identifiers are repeated many times across all resources.
+INTERNED_FIELDS = ("id", "id_v1", "rid")
+
+
+def _parse_interned_value(
+    name: str, value: Any, value_type: Any, default: Any = MISSING
+) -> Any:
+    """Parse a value and intern it if it is a string (e.g. resource identifiers)."""
+    value = _parse_value(name, value, value_type, default)
+    if type(value) is str:
+        return sys.intern(value)
+    return value
+
+
+def _parse_enum_value(
+    name: str, value: Any, value_type: type[Enum], default: Any = MISSING
+) -> Any:
+    """Parse a value for a field that is annotated with a (plain) Enum type."""
+    if value is None:
+        # let the generic parser handle defaults and required values
+        return _parse_value(name, value, value_type, default)
+    return parse_enum(value_type, value)
+
+
+def _get_parse_func(field: Field) -> Callable:
+    """Return the most specific parse function for a dataclass field."""
+    if field.name in INTERNED_FIELDS:
+        return _parse_interned_value
+    if isinstance(field.type, type) and issubclass(field.type, Enum):
+        return _parse_enum_value
+    return _parse_value
+
+
+@cache
+def _get_field_parsers(
+    cls: dataclass,
+) -> tuple[tuple[str, str, Callable, Any, Any], ...]:
+    """
+    Return the (cached) parse info for all fields of a dataclass.
+
+    Introspecting the dataclass fields is relatively expensive and the result
+    never changes, so this is done only once for each (model) class.
+    Derived (non-init) fields are not parsed from the raw data.
+    Returns tuple of (field name, full name, parse func, field type, field default).
+    """
+    return tuple(
+        (
+            field.name,
+            f"{cls.__name__}.{field.name}",
+            _get_parse_func(field),
+            field.type,
+            field.default,
+        )
+        for field in fields(cls)
+        if field.init
+    )
+
+
 def dataclass_from_dict(cls: dataclass, dict_obj: dict, strict=False):
     """
     Create (instance of) a dataclass by providing a dict with values.
@@ -237,8 +425,9 @@ def dataclass_from_dict(cls: dataclass, dict_obj: dict, strict=False):
     Including support for nested structures and common type conversions.
     If strict mode enabled, any additional keys in the provided dict will result in a KeyError.
     """
+    field_parsers = _get_field_parsers(cls)
     if strict:
-        extra_keys = dict_obj.keys() - set([f.name for f in fields(cls)])  # pylint: disable=consider-using-set-comprehension
+        extra_keys = dict_obj.keys() - {x[0] for x in field_parsers}
         if extra_keys:
             raise KeyError(
                 f"Extra key(s) {','.join(extra_keys)} not allowed for {cls!s}"
@@ -246,13 +435,8 @@ def dataclass_from_dict(cls: dataclass, dict_obj: dict, strict=False):
 
     return cls(
         **{
-            field.name: _parse_value(
-                f"{cls.__name__}.{field.name}",
-                dict_obj.get(field.name),
-                field.type,
-                field.default,
-            )
-            for field in fields(cls)
+            name: parse_func(full_name, dict_obj.get(name), value_type, default)
+            for name, full_name, parse_func, value_type, default in field_parsers
         }
     )
 
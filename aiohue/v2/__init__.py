@@ -13,6 +13,7 @@ import aiohttp
 from aiohttp import ClientResponse
 
 from aiohue.errors import BridgeBusy, Unauthorized, raise_from_error
+from aiohue.util import json_dumps, json_loads
 
 from .controllers.config import ConfigController
 from .controllers.devices import DevicesController
@@ -176,7 +177,7 @@ class HueBridgeV2:
                     raise Unauthorized
                 # raise on all other error status codes
                 resp.raise_for_status()
-                result = await resp.json()
+                result = await resp.json(loads=json_loads)
                 if result.get("errors"):
                     raise_from_error(result["errors"][0])
                 return result["data"]
@@ -199,7 +200,9 @@ class HueBridgeV2:
             connector = aiohttp.TCPConnector(
                 limit_per_host=3,
             )
-            self._websession = aiohttp.ClientSession(connector=connector)
+            self._websession = aiohttp.ClientSession(
+                connector=connector, json_serialize=json_dumps
+            )
 
         url = f"https://{self._host}/{path}"
 
@@ -237,10 +240,10 @@ class HueBridgeV2:
     ) -> None:
         """Handle (disconnect) event from the EventStream."""
         # pylint: disable=unused-argument
-        if event_type == EventType.DISCONNECTED:
+        if event_type is EventType.DISCONNECTED:
             # If we receive a disconnect event, we store the timestamp
             self._disconnect_timestamp = time.time()
-        elif event_type == EventType.RECONNECTED:  # noqa: SIM102
+        elif event_type is EventType.RECONNECTED:  # noqa: SIM102
             # if the time between the disconnect and reconnect is more than 1 minute,
             # we fetch the full state.
             if (time.time() - self._disconnect_timestamp) > 60:
@@ -137,7 +137,7 @@ class BaseResourcesController(Generic[CLIPResource]):
         Returns None if the resource id is (no longer) valid
         or does not belong to a device.
         """
-        if self.item_type == ResourceTypes.DEVICE:
+        if self.item_type is ResourceTypes.DEVICE:
             return self[id]
         for device in self._bridge.devices:
             for service in device.services:
@@ -195,7 +195,7 @@ class BaseResourcesController(Generic[CLIPResource]):
         if evt_data is None:
             return
         item_id = evt_data.get("rid", evt_data["id"])
-        if evt_type == EventType.RESOURCE_ADDED:
+        if evt_type is EventType.RESOURCE_ADDED:
             # new item added
             try:
                 cur_item = self._items[item_id] = dataclass_from_dict(
@@ -213,10 +213,10 @@ class BaseResourcesController(Generic[CLIPResource]):
                     exc_info=exc,
                 )
                 return
-        elif evt_type == EventType.RESOURCE_DELETED:
+        elif evt_type is EventType.RESOURCE_DELETED:
             # existing item deleted
             cur_item = self._items.pop(item_id, evt_data)
-        elif evt_type == EventType.RESOURCE_UPDATED:
+        elif evt_type is EventType.RESOURCE_UPDATED:
             # existing item updated
             cur_item = self._items.get(item_id)
             if cur_item is None:
@@ -225,7 +225,18 @@ class BaseResourcesController(Generic[CLIPResource]):
                 self._logger.warning("received update for unknown item %s", item_id)
                 return
             # update the existing data with the changed keys/data
-            updated_keys = update_dataclass(cur_item, evt_data)
+            try:
+                updated_keys = update_dataclass(cur_item, evt_data)
+            except (KeyError, ValueError, TypeError) as exc:
+                # same as for added resources, allow (some) resources to skip
+                # updates that can't be parsed instead of crashing the event stream.
+                if not self.allow_parser_error:
+                    raise exc
+                self._logger.error(
+                    "Unable to parse resource update, please report this to the authors of aiohue.",
+                    exc_info=exc,
+                )
+                return
             # do not forward update event at reconnects if no keys were updated
             if len(updated_keys) == 0 and is_reconnect:
                 return
@@ -236,11 +247,11 @@ class BaseResourcesController(Generic[CLIPResource]):
             # in fact this is a feature request to Signify to handle these stateless
             # device events in a different way:
             # https://developers.meethue.com/forum/t/differentiate-stateless-events/6627
-            if self.item_type == ResourceTypes.BUTTON and not evt_data.get(
+            if self.item_type is ResourceTypes.BUTTON and not evt_data.get(
                 "button", {}
             ).get("button_report"):
                 return
-            if self.item_type == ResourceTypes.RELATIVE_ROTARY and not evt_data.get(
+            if self.item_type is ResourceTypes.RELATIVE_ROTARY and not evt_data.get(
                 "relative_rotary", {}
             ).get("rotary_report"):
                 return
@@ -1,6 +1,6 @@
 """Controller holding and managing HUE resources that are of the config type."""
 
-from typing import TYPE_CHECKING, Union
+from typing import TYPE_CHECKING
 
 from awesomeversion import AwesomeVersion
 
@@ -109,7 +109,7 @@ class BehaviorInstanceController(BaseResourcesController[type[BehaviorInstance]]
 
 class ConfigController(
     GroupedControllerBase[
-        Union[Bridge, BridgeHome, Entertainment, EntertainmentConfiguration]  # noqa: UP007
+        Bridge | BridgeHome | Entertainment | EntertainmentConfiguration
     ]
 ):
     """
@@ -32,7 +32,7 @@ class DevicesController(BaseResourcesController[type[Device]]):
     def get_zigbee_connectivity(self, id: str) -> ZigbeeConnectivity | None:
         """Return the ZigbeeConnectivity resource connected to device."""
         for service in self._items[id].services:
-            if service.rtype == ResourceTypes.ZIGBEE_CONNECTIVITY:
+            if service.rtype is ResourceTypes.ZIGBEE_CONNECTIVITY:
                 return self._bridge.sensors.zigbee_connectivity.get(service.rid)
         return None
 
@@ -5,7 +5,6 @@ from asyncio.coroutines import iscoroutinefunction
 from collections import deque
 from collections.abc import Callable
 from enum import Enum
-import json
 import random
 import string
 from typing import TYPE_CHECKING, NoReturn, TypedDict
@@ -14,7 +13,7 @@ from aiohttp import ClientTimeout
 from aiohttp.client_exceptions import ClientError
 
 from aiohue.errors import AiohueException, InvalidAPIVersion, InvalidEvent, Unauthorized
-from aiohue.util import NoneType
+from aiohue.util import NoneType, json_loads, parse_enum
 from aiohue.v2.models.geofence_client import GeofenceClientPost, GeofenceClientPut
 from aiohue.v2.models.resource import ResourceTypes
 
@@ -86,7 +85,7 @@ class EventStream:
     @property
     def connected(self) -> bool:
         """Return bool if we're connected."""
-        return self._status == EventStreamStatus.CONNECTED
+        return self._status is EventStreamStatus.CONNECTED
 
     @property
     def status(self) -> bool:
@@ -153,7 +152,7 @@ class EventStream:
             if (
                 data is not None
                 and resource_filter is not None
-                and ResourceTypes(data.get("type")) not in resource_filter
+                and parse_enum(ResourceTypes, data.get("type")) not in resource_filter
             ):
                 continue
             if iscoroutinefunction(callback):
@@ -244,7 +243,7 @@ class EventStream:
             # each clip event has array of updated/added/deleted objects in data property
             # we fire an event for each object that was added/updated/deleted
             for item in event["data"]:
-                self.emit(EventType(event["type"]), item)
+                self.emit(parse_enum(EventType, event["type"]), item)
 
     def __parse_message(self, msg: bytes) -> None:
         """Parse a plain message string as received from EventStream."""
@@ -260,7 +259,7 @@ class EventStream:
                 return
             if key == "data":
                 # events is array with multiple events
-                events: list[HueEvent] = json.loads(value)
+                events: list[HueEvent] = json_loads(value)
                 for event in events:
                     if event.get("type") not in ["add", "update", "delete"]:
                         raise InvalidEvent(f"Received invalid event {event}")
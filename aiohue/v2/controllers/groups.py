@@ -1,7 +1,7 @@
 """Controller holding and managing HUE group resources."""
 
 import asyncio
-from typing import TYPE_CHECKING, Union
+from typing import TYPE_CHECKING
 
 from aiohue.v2.models.feature import (
     AlertEffectType,
@@ -69,9 +69,7 @@ class ZoneController(BaseResourcesController[type[Zone]]):
         """Return all lights in given zone."""
         if id not in self._items:
             return []
-        light_ids = {
-            x.rid for x in self._items[id].children if x.rtype == ResourceTypes.LIGHT
-        }
+        light_ids = self._items[id].lights
         return [x for x in self._bridge.lights if x.id in light_ids]
 
 
@@ -84,7 +82,7 @@ class GroupedLightController(BaseResourcesController[type[GroupedLight]]):
     def get_zone(self, id: str) -> Room | Zone | None:
         """Get the zone or room connected to grouped light."""
         for group in self._bridge.groups:
-            if group.type == ResourceTypes.GROUPED_LIGHT:
+            if group.type is ResourceTypes.GROUPED_LIGHT:
                 continue
             if group.grouped_light == id:
                 return group
@@ -94,7 +92,7 @@ class GroupedLightController(BaseResourcesController[type[GroupedLight]]):
         """Return lights of the connected room/zone."""
         # Note that this is just a convenience method for backwards compatibility
         if zone := self.get_zone(id):
-            if zone.type == ResourceTypes.ROOM:
+            if zone.type is ResourceTypes.ROOM:
                 return self._bridge.groups.room.get_lights(zone.id)
             return self._bridge.groups.zone.get_lights(zone.id)
         return []
@@ -168,7 +166,7 @@ class GroupedLightController(BaseResourcesController[type[GroupedLight]]):
         await self.update(id, update_obj)
 
 
-class GroupsController(GroupedControllerBase[Union[Room, Zone, GroupedLight]]):  # noqa: UP007
+class GroupsController(GroupedControllerBase[Room | Zone | GroupedLight]):
     """Controller grouping resources of both room and zone."""
 
     def __init__(self, bridge: "HueBridgeV2") -> None:
@@ -72,7 +72,7 @@ class ButtonController(BaseResourcesController[type[Button]]):
 
         # Handle longpress workaround if needed
         if not (
-            evt_type == EventType.RESOURCE_UPDATED
+            evt_type is EventType.RESOURCE_UPDATED
             and evt_data.get("button", {}).get("button_report", {}).get("event")
             == ButtonEvent.INITIAL_PRESS.value
         ):
@@ -107,7 +107,7 @@ class ButtonController(BaseResourcesController[type[Button]]):
         try:
             while count <= 20:  # = max 10 seconds
                 cur_event = self._items[id].button.button_report.event
-                if cur_event == ButtonEvent.SHORT_RELEASE:
+                if cur_event is ButtonEvent.SHORT_RELEASE:
                     break
                 # send REPEAT until short release is received
                 btn_resource["button"]["button_report"]["event"] = (
@@ -25,8 +25,8 @@ class BridgeHome:
     # Aggregation is per service type, ie every service type which can be grouped has a
     # corresponding definition of grouped type
     # Supported types “light”
-    services: list[ResourceIdentifier]
-    children: list[ResourceIdentifier]
+    services: tuple[ResourceIdentifier, ...]
+    children: tuple[ResourceIdentifier, ...]
 
     id_v1: str | None = None
     type: ResourceTypes = ResourceTypes.BRIDGE_HOME
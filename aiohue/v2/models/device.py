@@ -4,7 +4,7 @@ Model(s) for device resource on HUE bridge.
 https://developers.meethue.com/develop/hue-api-v2/api-reference/#resource_device
 """
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from enum import Enum
 
 from .feature import IdentifyFeature
@@ -111,22 +111,39 @@ class Device:
     # Aggregation is per service type, ie every service type which can be grouped has a
     # corresponding definition of grouped type
     # Supported types “light”
-    services: list[ResourceIdentifier]
+    services: tuple[ResourceIdentifier, ...]
     product_data: DeviceProductData
     metadata: DeviceMetaData
 
     id_v1: str | None = None
     type: ResourceTypes = ResourceTypes.DEVICE
 
+    # derived from services, (re)calculated in __post_init__
+    _lights: frozenset[str] = field(
+        default=frozenset(), init=False, repr=False, compare=False
+    )
+    _sensors: frozenset[str] = field(
+        default=frozenset(), init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self):
+        """Collect the light and sensor services of this device."""
+        self._lights = frozenset(
+            x.rid for x in self.services if x.rtype is ResourceTypes.LIGHT
+        )
+        self._sensors = frozenset(
+            x.rid for x in self.services if x.rtype in SENSOR_RESOURCE_TYPES
+        )
+
     @property
-    def lights(self) -> set[str]:
+    def lights(self) -> frozenset[str]:
         """Return a set of light id's belonging to this group/device."""
-        return {x.rid for x in self.services if x.rtype == ResourceTypes.LIGHT}
+        return self._lights
 
     @property
-    def sensors(self) -> set[str]:
+    def sensors(self) -> frozenset[str]:
         """Return a set of sensor id's belonging to this group/device."""
-        return {x.rid for x in self.services if x.rtype in SENSOR_RESOURCE_TYPES}
+        return self._sensors
 
 
 @dataclass
@@ -138,7 +138,7 @@ class EntertainmentConfiguration:
     stream_proxy: StreamingProxy
     channels: list[EntertainmentChannel]
     locations: EntertainmentLocations
-    light_services: list[ResourceIdentifier] | None = None
+    light_services: tuple[ResourceIdentifier, ...] | None = None
 
     active_streamer: ResourceIdentifier | None = None
     id_v1: str | None = None
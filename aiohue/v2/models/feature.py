@@ -1,18 +1,19 @@
 """Feature Schemas used by various Hue resources."""
 
-from dataclasses import dataclass, field
+from dataclasses import dataclass
 from datetime import datetime
 from enum import Enum
+from typing import ClassVar
 
 
-@dataclass
+@dataclass(slots=True)
 class OnFeature:
     """Represent `On` Feature object as used by various Hue resources."""
 
     on: bool
 
 
-@dataclass
+@dataclass(slots=True)
 class DimmingFeatureBase:
     """
     Represent `Dimming` Feature base properties.
@@ -25,7 +26,7 @@ class DimmingFeatureBase:
     brightness: float
 
 
-@dataclass
+@dataclass(slots=True)
 class DimmingFeature(DimmingFeatureBase):
     """Represent `Dimming` Feature object as used by various Hue resources."""
 
@@ -33,7 +34,7 @@ class DimmingFeature(DimmingFeatureBase):
     min_dim_level: float | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class DimmingFeaturePut(DimmingFeatureBase):
     """Represent `Dimming` Feature when updating/sending in PUT requests."""
 
@@ -46,7 +47,7 @@ class DeltaAction(Enum):
     STOP = "stop"
 
 
-@dataclass
+@dataclass(slots=True, kw_only=True)
 class DimmingDeltaFeaturePut:
     """
     Represent `DimmingDelta` Feature when updating/sending in PUT requests.
@@ -61,7 +62,7 @@ class DimmingDeltaFeaturePut:
     brightness_delta: float | None = None
 
 
-@dataclass
+@dataclass(slots=True, kw_only=True)
 class ColorTemperatureDeltaFeaturePut:
     """
     Represent `DimmingDelta` Feature when updating/sending in PUT requests.
@@ -75,7 +76,7 @@ class ColorTemperatureDeltaFeaturePut:
     mirek_delta: int | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class Position:
     """
     Represent Position object as used by the Hue api.
@@ -100,21 +101,21 @@ class AlertEffectType(Enum):
         return AlertEffectType.UNKNOWN
 
 
-@dataclass
+@dataclass(slots=True)
 class AlertFeature:
     """Represent AlertFeature object when retrieved from the Hue API."""
 
     action_values: list[AlertEffectType]
 
 
-@dataclass
+@dataclass(slots=True)
 class AlertFeaturePut:
     """Represent AlertFeature object when sent to the Hue API."""
 
     action: AlertEffectType
 
 
-@dataclass
+@dataclass(slots=True)
 class IdentifyFeature:
     """
     Represent IdentifyFeature object as used by the Hue api.
@@ -130,7 +131,7 @@ class IdentifyFeature:
     action: str = "identify"
 
 
-@dataclass
+@dataclass(slots=True)
 class ColorPoint:
     """
     CIE XY gamut position.
@@ -143,7 +144,7 @@ class ColorPoint:
     y: float
 
 
-@dataclass
+@dataclass(slots=True)
 class ColorGamut:
     """
     Color gamut of color bulb.
@@ -174,14 +175,14 @@ class GamutType(Enum):
     OTHER = "other"
 
 
-@dataclass
+@dataclass(slots=True)
 class ColorFeatureBase:
     """Represent `Color` Feature base/required properties."""
 
     xy: ColorPoint
 
 
-@dataclass
+@dataclass(slots=True)
 class ColorFeature(ColorFeatureBase):
     """Represent `Color` Feature object as used by various Hue resources."""
 
@@ -189,28 +190,34 @@ class ColorFeature(ColorFeatureBase):
     gamut: ColorGamut | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ColorFeaturePut(ColorFeatureBase):
     """Represent `Color` Feature when updating/sending in PUT requests."""
 
 
-@dataclass
+@dataclass(slots=True)
 class MirekSchema:
     """Represent Mirek schema."""
 
-    mirek_minimum: int = 153
-    mirek_maximum: int = 500
+    DEFAULT_MIREK_MINIMUM: ClassVar[int] = 153
+    DEFAULT_MIREK_MAXIMUM: ClassVar[int] = 500
+    # some devices report these (invalid) values
+    INVALID_MIREK_MINIMUM: ClassVar[int] = 0
+    INVALID_MIREK_MAXIMUM: ClassVar[int] = 65535
+
+    mirek_minimum: int = DEFAULT_MIREK_MINIMUM
+    mirek_maximum: int = DEFAULT_MIREK_MAXIMUM
 
     def __post_init__(self):
         """Auto correct invalid values."""
         # Fix for devices that provide wrong info
-        if self.mirek_minimum == 0:
-            self.mirek_minimum = 153
-        if self.mirek_maximum == 65535:
-            self.mirek_maximum = 500
+        if self.mirek_minimum == self.INVALID_MIREK_MINIMUM:
+            self.mirek_minimum = self.DEFAULT_MIREK_MINIMUM
+        if self.mirek_maximum == self.INVALID_MIREK_MAXIMUM:
+            self.mirek_maximum = self.DEFAULT_MIREK_MAXIMUM
 
 
-@dataclass
+@dataclass(slots=True)
 class ColorTemperatureFeatureBase:
     """Represent `ColorTemperature` Feature base/required properties."""
 
@@ -218,7 +225,7 @@ class ColorTemperatureFeatureBase:
     mirek: int | None
 
 
-@dataclass
+@dataclass(slots=True)
 class ColorTemperatureFeature(ColorTemperatureFeatureBase):
     """Represent `ColorTemperature` Feature object as used by various Hue resources."""
 
@@ -227,7 +234,7 @@ class ColorTemperatureFeature(ColorTemperatureFeatureBase):
     mirek_valid: bool
 
 
-@dataclass
+@dataclass(slots=True)
 class ColorTemperatureFeaturePut:
     """Represent `ColorTemperature` Feature when updating/sending in PUT requests."""
 
@@ -248,7 +255,7 @@ class DynamicStatus(Enum):
         return DynamicStatus.UNKNOWN
 
 
-@dataclass
+@dataclass(slots=True)
 class DynamicsFeature:
     """
     Represent `DynamicsFeature` object as used by various Hue resources.
@@ -269,10 +276,10 @@ class DynamicsFeature:
     status: DynamicStatus
     # status_values: required(array of SupportedDynamicStatus)
     # Statuses in which a lamp could be when playing dynamics.
-    status_values: list[DynamicStatus] = field(default_factory=list)
+    status_values: tuple[DynamicStatus, ...] = ()
 
 
-@dataclass
+@dataclass(slots=True, kw_only=True)
 class DynamicsFeaturePut:
     """
     Represent `DynamicsFeature` object when sent to the API in PUT requests.
@@ -308,7 +315,7 @@ class EffectStatus(Enum):
         return EffectStatus.UNKNOWN
 
 
-@dataclass
+@dataclass(slots=True)
 class SceneEffectsFeature:
     """
     Represent `EffectsFeature` base object as used by scenes.
@@ -319,7 +326,7 @@ class SceneEffectsFeature:
     effect: EffectStatus
 
 
-@dataclass
+@dataclass(slots=True)
 class EffectsFeature:
     """
     Represent `EffectsFeature` object as used by various Hue resources.
@@ -328,11 +335,11 @@ class EffectsFeature:
     """
 
     status: EffectStatus
-    effect_values: list[EffectStatus] = field(default_factory=list)
-    status_values: list[EffectStatus] = field(default_factory=list)
+    effect_values: tuple[EffectStatus, ...] = ()
+    status_values: tuple[EffectStatus, ...] = ()
 
 
-@dataclass
+@dataclass(slots=True, kw_only=True)
 class EffectsFeaturePut:
     """
     Represent `EffectsFeature` object when sent to the API in PUT requests.
@@ -357,7 +364,7 @@ class TimedEffectStatus(Enum):
         return TimedEffectStatus.UNKNOWN
 
 
-@dataclass
+@dataclass(slots=True)
 class TimedEffectsFeature:
     """
     Represent `TimedEffectsFeature` object as used by various Hue resources.
@@ -369,8 +376,8 @@ class TimedEffectsFeature:
 
     status: TimedEffectStatus
     effect: TimedEffectStatus | None = None  # seems to be replaced by 'status'
-    status_values: list[TimedEffectStatus] = field(default_factory=list)
-    effect_values: list[TimedEffectStatus] = field(default_factory=list)
+    status_values: tuple[TimedEffectStatus, ...] = ()
+    effect_values: tuple[TimedEffectStatus, ...] = ()
     # Duration is mandatory when timed effect is set except for no_effect.
     # Resolution decreases for a larger duration. e.g Effects with duration smaller
     # than a minute will be rounded to a resolution of 1s, while effects with duration
@@ -379,7 +386,7 @@ class TimedEffectsFeature:
     duration: int | None = None
 
 
-@dataclass
+@dataclass(slots=True, kw_only=True)
 class TimedEffectsFeaturePut:
     """
     Represent `TimedEffectsFeature` object when sent to the API in PUT requests.
@@ -404,7 +411,7 @@ class RecallAction(Enum):
     DYNAMIC_PALETTE = "dynamic_palette"
 
 
-@dataclass
+@dataclass(slots=True, kw_only=True)
 class RecallFeature:
     """
     Properties to send when calling/setting the `Recall` feature (of a scene) on the api.
@@ -427,7 +434,7 @@ class RecallFeature:
     dimming: DimmingFeatureBase | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class PaletteFeatureColor:
     """Represents Color object used in PaletteFeature."""
 
@@ -435,7 +442,7 @@ class PaletteFeatureColor:
     dimming: DimmingFeatureBase
 
 
-@dataclass
+@dataclass(slots=True)
 class PaletteFeatureColorTemperature:
     """Represents ColorTemperature object used in PaletteFeature."""
 
@@ -443,7 +450,7 @@ class PaletteFeatureColorTemperature:
     dimming: DimmingFeatureBase
 
 
-@dataclass
+@dataclass(slots=True)
 class PaletteFeature:
     """
     Group of colors that describe the palette of colors to be used when playing dynamics.
@@ -459,7 +466,7 @@ class PaletteFeature:
     color_temperature: list[PaletteFeatureColorTemperature]
 
 
-@dataclass
+@dataclass(slots=True)
 class GradientPoint:
     """Represent a single Gradient (color) Point."""
 
@@ -474,7 +481,7 @@ class GradientMode(Enum):
     RANDOM_PIXELATED = "random_pixelated"
 
 
-@dataclass
+@dataclass(slots=True)
 class GradientFeatureBase:
     """Represent GradientFeature base properties."""
 
@@ -483,7 +490,7 @@ class GradientFeatureBase:
     points: list[GradientPoint]
 
 
-@dataclass
+@dataclass(slots=True)
 class GradientFeature(GradientFeatureBase):
     """
     Represent GradientFeature as used by the lights entities.
@@ -497,7 +504,7 @@ class GradientFeature(GradientFeatureBase):
     # mode: Mode in which the points are currently being deployed.
     # If not provided during PUT/POST it will be defaulted to interpolated_palette
     mode: GradientMode = GradientMode.INTERPOLATED_PALETTE
-    mode_values: list[GradientMode] = field(default_factory=list)
+    mode_values: tuple[GradientMode, ...] = ()
     pixel_count: int | None = None  # Number of pixels in the device
 
 
@@ -520,7 +527,7 @@ class Signal(Enum):
         return Signal.UNKNOWN
 
 
-@dataclass
+@dataclass(slots=True)
 class SignalingFeatureStatus:
     """Indicates status of active signal. Not available when inactive."""
 
@@ -529,17 +536,17 @@ class SignalingFeatureStatus:
     colors: list[ColorFeatureBase] | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class SignalingFeature:
     """Feature containing signaling properties."""
 
     # status: Indicates status of active signal. Not available when inactive.
     status: SignalingFeatureStatus | None = None
     # signal_values: Signals that the light supports.
-    signal_values: list[Signal] = field(default_factory=list)
+    signal_values: tuple[Signal, ...] = ()
 
 
-@dataclass
+@dataclass(slots=True)
 class SignalingFeaturePut:
     """Represent SignalingFeature object when sent to the Hue API."""
 
@@ -573,7 +580,7 @@ class PowerUpFeatureOnMode(Enum):
     PREVIOUS = "previous"
 
 
-@dataclass
+@dataclass(slots=True)
 class PowerUpFeatureOnState:
     """
     State to activate after powerup.
@@ -595,7 +602,7 @@ class PowerUpFeatureDimmingMode(Enum):
     PREVIOUS = "previous"
 
 
-@dataclass
+@dataclass(slots=True)
 class PowerUpFeatureDimmingState:
     """
     Dimming will set the brightness to the specified value after power up.
@@ -616,7 +623,7 @@ class PowerUpFeatureColorMode(Enum):
     PREVIOUS = "previous"
 
 
-@dataclass
+@dataclass(slots=True)
 class PowerUpFeatureColorState:
     """
     Color state to activate after powerup.
@@ -634,7 +641,7 @@ class PowerUpFeatureColorState:
     color: ColorFeatureBase | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class PowerUpFeature:
     """
     Feature containing properties to configure powerup behaviour of a lightsource.
@@ -651,7 +658,7 @@ class PowerUpFeature:
     color: PowerUpFeatureColorState | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class PowerUpFeaturePut:
     """
     PowerUp feature properties that can be set/updated with a PUT request.
@@ -665,7 +672,7 @@ class PowerUpFeaturePut:
     color: PowerUpFeatureColorState | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class MotionReport:
     """
     Represent MotionReport as retrieved from api.
@@ -677,7 +684,7 @@ class MotionReport:
     motion: bool
 
 
-@dataclass
+@dataclass(slots=True)
 class MotionSensingFeature:
     """
     Represent MotionSensingFeature object as retrieved from api.
@@ -711,7 +718,7 @@ class MotionSensingFeatureSensitivityStatus(Enum):
         return MotionSensingFeatureSensitivityStatus.UNKNOWN
 
 
-@dataclass
+@dataclass(slots=True)
 class MotionSensingFeatureSensitivity:
     """
     Represent MotionSensingFeatureSensitivity as retrieved from api.
@@ -724,7 +731,7 @@ class MotionSensingFeatureSensitivity:
     sensitivity_max: int = 10
 
 
-@dataclass
+@dataclass(slots=True)
 class MotionSensingFeatureSensitivityPut:
     """
     Represent MotionSensingFeatureSensitivity when set/updated with a PUT request.
@@ -9,7 +9,7 @@ from dataclasses import dataclass
 from .resource import ResourceTypes
 
 
-@dataclass
+@dataclass(slots=True)
 class GeofenceClient:
     """
     Represent a (full) `GeofenceClient` resource when retrieved from the api.
@@ -23,7 +23,7 @@ class GeofenceClient:
     type: ResourceTypes = ResourceTypes.GEOFENCE_CLIENT
 
 
-@dataclass
+@dataclass(slots=True, kw_only=True)
 class GeofenceClientPut:
     """
     GeofenceClient resource properties that can be set/updated with a PUT request.
@@ -35,7 +35,7 @@ class GeofenceClientPut:
     name: str | None = None
 
 
-@dataclass
+@dataclass(slots=True, kw_only=True)
 class GeofenceClientPost:
     """
     GeofenceClient resource properties that can be set with a POST request.
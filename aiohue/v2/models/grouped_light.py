@@ -6,6 +6,8 @@ https://developers.meethue.com/develop/hue-api-v2/api-reference/#resource_groupe
 
 from dataclasses import dataclass
 
+from aiohue.util import compact_repr
+
 from .feature import (
     AlertFeature,
     AlertFeaturePut,
@@ -22,7 +24,7 @@ from .feature import (
 from .resource import ResourceIdentifier, ResourceTypes
 
 
-@dataclass
+@dataclass(slots=True, repr=False)
 class GroupedLight:
     """
     Represent a (full) GroupedLight object when retrieved from the api.
@@ -43,8 +45,10 @@ class GroupedLight:
     signaling: SignalingFeature | None = None
     type: ResourceTypes = ResourceTypes.GROUPED_LIGHT
 
+    __repr__ = compact_repr
+
 
-@dataclass
+@dataclass(slots=True, kw_only=True)
 class GroupedLightPut:
     """
     Represent a GroupedLight model when sending a PUT request.
@@ -7,6 +7,8 @@ https://developers.meethue.com/develop/hue-api-v2/api-reference/#resource_homeki
 from dataclasses import dataclass
 from enum import Enum
 
+from aiohue.util import compact_repr
+
 from .resource import ResourceTypes
 
 
@@ -27,7 +29,7 @@ class HomekitAction(Enum):
     # to factory settings. The Homekit will start functioning after approximately 10 seconds.
 
 
-@dataclass
+@dataclass(slots=True, repr=False)
 class Homekit:
     """
     Represent a (full) `Homekit` resource when retrieved from the api.
@@ -41,8 +43,10 @@ class Homekit:
     id_v1: str | None = None
     type: ResourceTypes = ResourceTypes.HOMEKIT
 
+    __repr__ = compact_repr
+
 
-@dataclass
+@dataclass(slots=True)
 class HomekitPut:
     """
     Homekit resource properties that can be set/updated with a PUT request.
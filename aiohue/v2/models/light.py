@@ -36,7 +36,7 @@ from .feature import (
 from .resource import ResourceIdentifier, ResourceTypes
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class LightMetaData:
     """
     Represent LightMetaData object as used by the Hue api.
@@ -60,7 +60,7 @@ class LightMode(Enum):
     STREAMING = "streaming"
 
 
-@dataclass
+@dataclass(slots=True)
 class Light:
     """
     Represent a (full) `Light` resource when retrieved from the api.
@@ -122,16 +122,16 @@ class Light:
     def is_dynamic(self) -> bool:
         """Return bool if light is currently dynamically changing colors from a scene."""
         if self.dynamics is not None:
-            return self.dynamics.status == DynamicStatus.DYNAMIC_PALETTE
+            return self.dynamics.status is DynamicStatus.DYNAMIC_PALETTE
         return False
 
     @property
     def entertainment_active(self) -> bool:
         """Return bool if this light is currently streaming in Entertainment mode."""
-        return self.mode == LightMode.STREAMING
+        return self.mode is LightMode.STREAMING
 
 
-@dataclass
+@dataclass(slots=True)
 class LightPut:
     """
     Light resource properties that can be set/updated with a PUT request.
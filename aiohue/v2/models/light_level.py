@@ -10,7 +10,7 @@ from datetime import datetime
 from .resource import ResourceIdentifier, ResourceTypes
 
 
-@dataclass
+@dataclass(slots=True)
 class LightLevelReport:
     """
     Represent LightLevelReport as retrieved from api.
@@ -22,7 +22,7 @@ class LightLevelReport:
     light_level: int
 
 
-@dataclass
+@dataclass(slots=True)
 class LightLevelFeature:
     """Represent LightLevel Feature used by Lightlevel resources."""
 
@@ -39,7 +39,7 @@ class LightLevelFeature:
         return self.light_level
 
 
-@dataclass
+@dataclass(slots=True)
 class LightLevel:
     """
     Represent a (full) `LightLevel` resource when retrieved from the api.
@@ -56,7 +56,7 @@ class LightLevel:
     type: ResourceTypes = ResourceTypes.LIGHT_LEVEL
 
 
-@dataclass
+@dataclass(slots=True)
 class LightLevelPut:
     """
     LightLevel resource properties that can be set/updated with a PUT request.
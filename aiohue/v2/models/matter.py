@@ -21,7 +21,7 @@ class MatterAction(Enum):
     RESET = "reset"
 
 
-@dataclass
+@dataclass(slots=True)
 class Matter:
     """
     Represent a (full) `Matter` resource when retrieved from the api.
@@ -37,7 +37,7 @@ class Matter:
     type: ResourceTypes = ResourceTypes.MATTER
 
 
-@dataclass
+@dataclass(slots=True)
 class MatterPut:
     """
     Matter resource properties that can be set/updated with a PUT request.
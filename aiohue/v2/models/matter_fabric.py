@@ -19,7 +19,7 @@ class MatterFabricStatus(Enum):
     TIMEDOUT = "timedout"
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class MatterFabricData:
     """Human readable context to identify Matter fabric."""
 
@@ -27,7 +27,7 @@ class MatterFabricData:
     vendor_id: int
 
 
-@dataclass
+@dataclass(slots=True)
 class MatterFabric:
     """
     Represent a (full) `MatterFabric` resource when retrieved from the api.
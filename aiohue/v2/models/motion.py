@@ -14,7 +14,7 @@ from .feature import (
 from .resource import ResourceIdentifier, ResourceTypes
 
 
-@dataclass
+@dataclass(slots=True)
 class Motion:
     """
     Represent a (full) `Motion` resource when retrieved from the api.
@@ -34,7 +34,7 @@ class Motion:
     type: ResourceTypes = ResourceTypes.MOTION
 
 
-@dataclass
+@dataclass(slots=True)
 class MotionPut:
     """
     Motion resource properties that can be set/updated with a PUT request.
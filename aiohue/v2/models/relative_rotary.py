@@ -7,6 +7,7 @@ https://developers.meethue.com/develop/hue-api-v2/api-reference/#resource_relati
 from dataclasses import dataclass
 from datetime import datetime
 from enum import Enum
+from typing import ClassVar
 
 from .resource import ResourceIdentifier, ResourceTypes
 
@@ -31,7 +32,7 @@ class RelativeRotaryDirection(Enum):
     COUNTER_CLOCK_WISE = "counter_clock_wise"
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class RelativeRotaryRotation:
     """
     Represent Rotation object as used by the Hue api.
@@ -54,7 +55,7 @@ class RelativeRotaryRotation:
     steps: int
 
 
-@dataclass
+@dataclass(slots=True)
 class RelativeRotaryEvent:
     """Represent RelativeRotaryEvent object as used by the Hue api."""
 
@@ -62,7 +63,7 @@ class RelativeRotaryEvent:
     rotation: RelativeRotaryRotation
 
 
-@dataclass
+@dataclass(slots=True)
 class RelativeRotaryReport:
     """Represent RelativeRotaryReport object as used by the Hue api."""
 
@@ -71,7 +72,7 @@ class RelativeRotaryReport:
     updated: datetime
 
 
-@dataclass
+@dataclass(slots=True)
 class RelativeRotaryFeature:
     """Represent RelativeRotaryFeature object as used by the Hue api."""
 
@@ -87,7 +88,7 @@ class RelativeRotaryFeature:
         return self.last_event
 
 
-@dataclass
+@dataclass(slots=True)
 class RelativeRotary:
     """
     Represent a (full) `RelativeRotary` resource when retrieved from the api.
@@ -100,4 +101,4 @@ class RelativeRotary:
 
     relative_rotary: RelativeRotaryFeature | None = None
     id_v1: str | None = None
-    type: ResourceTypes = ResourceTypes.RELATIVE_ROTARY
+    type: ClassVar[ResourceTypes] = ResourceTypes.RELATIVE_ROTARY
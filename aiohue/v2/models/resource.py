@@ -2,6 +2,10 @@
 
 from dataclasses import dataclass
 from enum import Enum
+from functools import lru_cache
+import sys
+
+from aiohue.util import parse_enum
 
 
 class ResourceTypes(Enum):
@@ -58,23 +62,27 @@ class ResourceTypes(Enum):
         return ResourceTypes.UNKNOWN
 
 
-SENSOR_RESOURCE_TYPES = (
-    ResourceTypes.DEVICE_POWER,
-    ResourceTypes.BUTTON,
-    ResourceTypes.GEOFENCE_CLIENT,
-    ResourceTypes.LIGHT_LEVEL,
-    ResourceTypes.MOTION,
-    ResourceTypes.RELATIVE_ROTARY,
-    ResourceTypes.TEMPERATURE,
-    ResourceTypes.ZIGBEE_CONNECTIVITY,
+SENSOR_RESOURCE_TYPES = frozenset(
+    {
+        ResourceTypes.DEVICE_POWER,
+        ResourceTypes.BUTTON,
+        ResourceTypes.GEOFENCE_CLIENT,
+        ResourceTypes.LIGHT_LEVEL,
+        ResourceTypes.MOTION,
+        ResourceTypes.RELATIVE_ROTARY,
+        ResourceTypes.TEMPERATURE,
+        ResourceTypes.ZIGBEE_CONNECTIVITY,
+    }
 )
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ResourceIdentifier:
     """
     Represent a ResourceIdentifier object as used by the Hue api.
 
+    Identifiers are immutable (and thus hashable) once created.
+
     clip-api.schema.json#/definitions/ResourceIdentifierGet
     clip-api.schema.json#/definitions/ResourceIdentifierPost
     clip-api.schema.json#/definitions/ResourceIdentifierPut
@@ -83,3 +91,21 @@ class ResourceIdentifier:
 
     rid: str  # UUID
     rtype: ResourceTypes
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "ResourceIdentifier":
+        """Return (shared) ResourceIdentifier for (raw) dict."""
+        return _get_resource_identifier(data["rid"], data["rtype"])
+
+
+@lru_cache(maxsize=4096)
+def _get_resource_identifier(rid: str, rtype: str) -> ResourceIdentifier:
+    """
+    Return (cached) ResourceIdentifier for given rid and rtype.
+
+    The same identifiers are referenced many times across all resources
+    and identifiers are immutable, so they can be shared safely.
+    """
+    return ResourceIdentifier(
+        rid=sys.intern(rid), rtype=parse_enum(ResourceTypes, rtype)
+    )
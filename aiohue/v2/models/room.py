@@ -4,8 +4,11 @@ Model(s) for Room resource on HUE bridge.
 https://developers.meethue.com/develop/hue-api-v2/api-reference/#resource_room
 """
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from enum import Enum
+from typing import ClassVar
+
+from aiohue.util import compact_repr
 
 from .resource import ResourceIdentifier, ResourceTypes
 
@@ -60,7 +63,7 @@ class RoomArchetype(Enum):
         return RoomArchetype.OTHER
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class RoomMetaData:
     """Represent MetaData for a room resource."""
 
@@ -68,7 +71,7 @@ class RoomMetaData:
     name: str
 
 
-@dataclass
+@dataclass(slots=True)
 class RoomMetaDataPut:
     """
     Represent Room MetaData properties on update/PUT.
@@ -80,7 +83,7 @@ class RoomMetaDataPut:
     name: str | None
 
 
-@dataclass
+@dataclass(slots=True, repr=False)
 class Room:
     """
     Represent a (full) `Room` object as retrieved from the Hue api.
@@ -96,33 +99,46 @@ class Room:
     # Aggregation is per service type, ie every service type which can be grouped has a
     # corresponding definition of grouped type
     # Supported types “light”
-    services: list[ResourceIdentifier]
+    services: tuple[ResourceIdentifier, ...]
     metadata: RoomMetaData
 
     # children: required(array of ResourceIdentifier)
     # Devices to group by the Room Following children are allowed: device
-    children: list[ResourceIdentifier]
+    children: tuple[ResourceIdentifier, ...]
 
     id_v1: str | None = None
-    type: ResourceTypes = ResourceTypes.ROOM
+    type: ClassVar[ResourceTypes] = ResourceTypes.ROOM
+
+    # derived from children/services, (re)calculated in __post_init__
+    _devices: frozenset[str] = field(
+        default=frozenset(), init=False, repr=False, compare=False
+    )
+    _grouped_light: str | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self):
+        """Collect the devices and grouped light of this room."""
+        self._devices = frozenset(x.rid for x in self.children)
+        self._grouped_light = next(
+            (x.rid for x in self.services if x.rtype is ResourceTypes.GROUPED_LIGHT),
+            None,
+        )
 
     @property
-    def devices(self) -> set[str]:
+    def devices(self) -> frozenset[str]:
         """Return set of device id's that belong to this room."""
-        return {x.rid for x in self.children}
+        return self._devices
 
     @property
     def grouped_light(self) -> str | None:
         """Return the grouped light id that is connected to this room (if any)."""
-        if not self.services:
-            return None
-        return next(
-            (x.rid for x in self.services if x.rtype == ResourceTypes.GROUPED_LIGHT),
-            None,
-        )
+        return self._grouped_light
+
+    __repr__ = compact_repr
 
 
-@dataclass
+@dataclass(slots=True)
 class RoomPut:
     """
     Properties to send when updating/setting a `Room` object on the api.
@@ -134,7 +150,7 @@ class RoomPut:
     metadata: RoomMetaDataPut | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class RoomPost:
     """
     Properties to send when creating a `Room` object on the api.
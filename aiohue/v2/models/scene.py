@@ -5,6 +5,9 @@ https://developers.meethue.com/develop/hue-api-v2/api-reference/#resource_scene
 """
 
 from dataclasses import dataclass
+from typing import ClassVar
+
+from aiohue.util import compact_repr
 
 from .feature import (
     ColorFeatureBase,
@@ -20,7 +23,7 @@ from .feature import (
 from .resource import ResourceIdentifier, ResourceTypes
 
 
-@dataclass
+@dataclass(slots=True)
 class ActionAction:
     """Represent (scene) `ActionAction` model."""
 
@@ -33,7 +36,7 @@ class ActionAction:
     dynamics: DynamicsFeaturePut | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class Action:
     """Represent (scene) `Action` model."""
 
@@ -41,7 +44,7 @@ class Action:
     action: ActionAction
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class SceneMetadata:
     """Represent SceneMetadata object as used by the Hue api."""
 
@@ -49,14 +52,14 @@ class SceneMetadata:
     image: ResourceIdentifier | None = None
 
 
-@dataclass
+@dataclass(slots=True, kw_only=True)
 class SceneMetadataPut:
     """Represent SceneMetadata model when sent/updated to the API with PUT request."""
 
     name: str
 
 
-@dataclass
+@dataclass(slots=True, repr=False)
 class Scene:
     """
     Represent (full) `Scene` Model when retrieved from the API.
@@ -72,7 +75,7 @@ class Scene:
     group: ResourceIdentifier
     # actions: required(array of Action)
     # List of actions to be executed synchronously on recall
-    actions: list[Action]
+    actions: tuple[Action, ...]
     # speed: required(number – minimum: 0 – maximum: 1)
     speed: float
     # auto_dynamic: whether to automatically start the scene dynamically on active recall
@@ -82,10 +85,12 @@ class Scene:
     id_v1: str | None = None
     palette: PaletteFeature | None = None
 
-    type: ResourceTypes = ResourceTypes.SCENE
+    type: ClassVar[ResourceTypes] = ResourceTypes.SCENE
 
+    __repr__ = compact_repr
 
-@dataclass
+
+@dataclass(slots=True, kw_only=True)
 class ScenePut:
     """
     Properties to send when updating/setting a `Scene` object on the api.
@@ -97,14 +102,13 @@ class ScenePut:
     actions: list[Action] | None = None
     palette: PaletteFeature | None = None
     recall: RecallFeature | None = None
-    palette: PaletteFeature | None = None
     # speed: (number – minimum: 0 – maximum: 1)
     # Speed of dynamic palette for this scene
     speed: float | None = None
     auto_dynamic: bool | None = None
 
 
-@dataclass
+@dataclass(slots=True, kw_only=True)
 class ScenePost:
     """
     Properties to send when creating a `Scene` object on the api.
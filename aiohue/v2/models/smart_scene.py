@@ -6,6 +6,9 @@ https://developers.meethue.com/develop/hue-api-v2/api-reference/#resource_smart_
 
 from dataclasses import dataclass
 from enum import Enum
+from typing import ClassVar
+
+from aiohue.util import compact_repr
 
 from .resource import ResourceIdentifier, ResourceTypes
 from .scene import SceneMetadata, SceneMetadataPut
@@ -35,9 +38,9 @@ class SmartSceneState(Enum):
         return SmartSceneState.INACTIVE
 
 
-@dataclass
+@dataclass(frozen=True, slots=True, order=True)
 class TimeslotStartTimeTime:
-    """Time object."""
+    """Time object, ordered chronologically within the day."""
 
     hour: int  # minimum: 0 – maximum: 23
     minute: int  # minimum: 0 – maximum: 59
@@ -45,15 +48,15 @@ class TimeslotStartTimeTime:
 
     def __post_init__(self):
         """Validate values."""
-        if self.hour < 0 or self.hour > 23:
+        if not 0 <= self.hour <= 23:
             raise ValueError("Hour must be a value within range of 0 and 23")
-        if self.minute < 0 or self.minute > 59:
+        if not 0 <= self.minute <= 59:
             raise ValueError("Minute must be a value within range of 0 and 59")
-        if self.second < 0 or self.second > 59:
+        if not 0 <= self.second <= 59:
             raise ValueError("Second must be a value within range of 0 and 59")
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class TimeslotStartTime:
     """Representation of a Start time object within a timeslot."""
 
@@ -61,7 +64,7 @@ class TimeslotStartTime:
     time: TimeslotStartTimeTime
 
 
-@dataclass
+@dataclass(slots=True)
 class SmartSceneTimeslot:
     """
     Represent SmartSceneTimeslot as used by Smart Scenes.
@@ -73,7 +76,7 @@ class SmartSceneTimeslot:
     target: ResourceIdentifier
 
 
-@dataclass
+@dataclass(slots=True)
 class DayTimeSlots:
     """Represent DayTimeSlots information, used by Smart Scenes."""
 
@@ -81,7 +84,7 @@ class DayTimeSlots:
     recurrence: list[WeekDay]
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class SmartSceneActiveTimeslot:
     """The active time slot in execution."""
 
@@ -89,7 +92,7 @@ class SmartSceneActiveTimeslot:
     weekday: WeekDay
 
 
-class SmartSceneRecallAction:
+class SmartSceneRecallAction(Enum):
     """
     Enum with possible recall actions for smart scenes.
 
@@ -100,14 +103,14 @@ class SmartSceneRecallAction:
     DEACTIVATE = "deactivate"
 
 
-@dataclass
+@dataclass(slots=True, kw_only=True)
 class SmartSceneRecall:
     """Properties to send when activating a Smart Scene."""
 
     action: SmartSceneRecallAction
 
 
-@dataclass
+@dataclass(slots=True, repr=False)
 class SmartScene:
     """
     Represent (full) `SmartScene` Model when retrieved from the API.
@@ -134,10 +137,12 @@ class SmartScene:
     active_timeslot: SmartSceneActiveTimeslot | None = None
     id_v1: str | None = None
 
-    type: ResourceTypes = ResourceTypes.SMART_SCENE
+    type: ClassVar[ResourceTypes] = ResourceTypes.SMART_SCENE
+
+    __repr__ = compact_repr
 
 
-@dataclass
+@dataclass(slots=True, kw_only=True)
 class SmartScenePut:
     """
     Properties to send when updating/setting a `SmartScene` object on the api.
@@ -150,7 +155,7 @@ class SmartScenePut:
     recall: SmartSceneRecall | None = None
 
 
-@dataclass
+@dataclass(slots=True, kw_only=True)
 class SmartSceneScenePost:
     """
     Properties to send when creating a `SmartScene` object on the api.
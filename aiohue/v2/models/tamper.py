@@ -4,9 +4,10 @@ Model(s) for tamper resource on HUE bridge.
 https://developers.meethue.com/develop/hue-api-v2/api-reference/#resource_tamper
 """
 
-from dataclasses import dataclass, field
+from dataclasses import dataclass
 from datetime import datetime
 from enum import Enum
+from typing import ClassVar
 
 from .resource import ResourceIdentifier, ResourceTypes
 
@@ -30,7 +31,7 @@ class TamperSource(Enum):
         return TamperSource.UNKNOWN
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class TamperReport:
     """
     Represent TamperReport as retrieved from api.
@@ -43,7 +44,7 @@ class TamperReport:
     state: TamperState
 
 
-@dataclass
+@dataclass(slots=True)
 class Tamper:
     """
     Represent a (full) `Tamper` resource when retrieved from the api.
@@ -53,7 +54,7 @@ class Tamper:
 
     id: str
     owner: ResourceIdentifier
-    tamper_reports: list[TamperReport] = field(default_factory=list)
+    tamper_reports: tuple[TamperReport, ...] = ()
 
     id_v1: str | None = None
-    type: ResourceTypes = ResourceTypes.CONTACT
+    type: ClassVar[ResourceTypes] = ResourceTypes.TAMPER
@@ -6,11 +6,12 @@ https://developers.meethue.com/develop/hue-api-v2/api-reference/#resource_temper
 
 from dataclasses import dataclass
 from datetime import datetime
+from typing import ClassVar
 
 from .resource import ResourceIdentifier, ResourceTypes
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class TemperatureReport:
     """
     Represent TemperatureReport as retrieved from api.
@@ -22,7 +23,7 @@ class TemperatureReport:
     temperature: float
 
 
-@dataclass
+@dataclass(slots=True)
 class TemperatureSensingFeature:
     """Represent TemperatureFeature."""
 
@@ -39,7 +40,7 @@ class TemperatureSensingFeature:
         return self.temperature
 
 
-@dataclass
+@dataclass(slots=True)
 class Temperature:
     """
     Represent a (full) `Temperature` resource when retrieved from the api.
@@ -53,10 +54,10 @@ class Temperature:
     temperature: TemperatureSensingFeature
 
     id_v1: str | None = None
-    type: ResourceTypes = ResourceTypes.TEMPERATURE
+    type: ClassVar[ResourceTypes] = ResourceTypes.TEMPERATURE
 
 
-@dataclass
+@dataclass(slots=True)
 class TemperaturePut:
     """
     Temperature resource properties that can be set/updated with a PUT request.
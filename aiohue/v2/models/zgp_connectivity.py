@@ -5,12 +5,13 @@ https://developers.meethue.com/develop/hue-api-v2/api-reference/#resource_zgp_co
 """
 
 from dataclasses import dataclass
+from typing import ClassVar
 
 from .resource import ResourceIdentifier, ResourceTypes
 from .zigbee_connectivity import ConnectivityServiceStatus
 
 
-@dataclass
+@dataclass(slots=True)
 class ZgpConnectivity:
     """
     Represent a (full) `ZgpConnectivity` resource when retrieved from the api.
@@ -23,4 +24,4 @@ class ZgpConnectivity:
     status: ConnectivityServiceStatus
     source_id: str
     id_v1: str | None = None
-    type: ResourceTypes = ResourceTypes.ZGP_CONNECTIVITY
+    type: ClassVar[ResourceTypes] = ResourceTypes.ZGP_CONNECTIVITY
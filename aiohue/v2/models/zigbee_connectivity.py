@@ -6,6 +6,7 @@ https://developers.meethue.com/develop/hue-api-v2/api-reference/#resource_zigbee
 
 from dataclasses import dataclass
 from enum import Enum
+from typing import ClassVar
 
 from .resource import ResourceIdentifier, ResourceTypes
 
@@ -25,7 +26,7 @@ class ConnectivityServiceStatus(Enum):
     UNIDIRECTIONAL_INCOMING = "unidirectional_incoming"
 
 
-@dataclass
+@dataclass(slots=True)
 class ZigbeeConnectivity:
     """
     Represent a (full) `ZigbeeConnectivity` resource when retrieved from the api.
@@ -38,4 +39,4 @@ class ZigbeeConnectivity:
     status: ConnectivityServiceStatus
     mac_address: str
     id_v1: str | None = None
-    type: ResourceTypes = ResourceTypes.ZIGBEE_CONNECTIVITY
+    type: ClassVar[ResourceTypes] = ResourceTypes.ZIGBEE_CONNECTIVITY
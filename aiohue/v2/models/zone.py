@@ -4,13 +4,14 @@ Model(s) for Zone resource on HUE bridge.
 https://developers.meethue.com/develop/hue-api-v2/api-reference/#resource_zone
 """
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from typing import ClassVar
 
 from .resource import ResourceTypes
 from .room import Room, RoomPost, RoomPut
 
 
-@dataclass
+@dataclass(slots=True, repr=False)
 class Zone(Room):
     """
     Represent a (full) `Zone` object as retrieved from the Hue api.
@@ -19,10 +20,27 @@ class Zone(Room):
     https://developers.meethue.com/develop/hue-api-v2/api-reference/#resource_zone_get
     """
 
-    type: ResourceTypes = ResourceTypes.ZONE
+    type: ClassVar[ResourceTypes] = ResourceTypes.ZONE
 
+    # derived from children, (re)calculated in __post_init__
+    _lights: frozenset[str] = field(
+        default=frozenset(), init=False, repr=False, compare=False
+    )
 
-@dataclass
+    def __post_init__(self):
+        """Collect the devices, lights and grouped light of this zone."""
+        Room.__post_init__(self)
+        self._lights = frozenset(
+            x.rid for x in self.children if x.rtype is ResourceTypes.LIGHT
+        )
+
+    @property
+    def lights(self) -> frozenset[str]:
+        """Return set of light id's that belong to this zone."""
+        return self._lights
+
+
+@dataclass(slots=True)
 class ZonePut(RoomPut):
     """
     Properties to send when updating/setting a `Zone` object on the api.
@@ -31,7 +49,7 @@ class ZonePut(RoomPut):
     """
 
 
-@dataclass
+@dataclass(slots=True)
 class ZonePost(RoomPost):
     """
     Properties to send when creating a `Zone` object on the api.
@@ -49,9 +49,7 @@ async def main():
         print("Subscribing to events...")
 
         def print_event(event_type, item):
-            print()
-            print("received event", event_type.value, item)
-            print()
+            print(f"\nreceived event {event_type.value} {item}\n")
 
         bridge.subscribe(print_event)
 
@@ -4,9 +4,13 @@ from dataclasses import dataclass
 from unittest.mock import Mock
 from uuid import uuid4
 
+import pytest
+
 from aiohue import HueBridgeV2
 from aiohue.v2 import EventType
 from aiohue.v2.controllers.base import BaseResourcesController
+from aiohue.v2.controllers.groups import RoomController
+from aiohue.v2.controllers.scenes import SmartScenesController
 from aiohue.v2.models.resource import ResourceTypes
 
 
@@ -110,3 +114,88 @@ async def test_handle_event():
     await controller._handle_event(EventType.RESOURCE_UPDATED, evt_data)
 
     callback.assert_not_called()
+
+
+async def test_handle_invalid_update_event():
+    """Test an update event that can't be parsed is skipped (if allowed)."""
+    bridge = HueBridgeV2("127.0.0.1", "fake")
+    controller = SmartScenesController(bridge)
+    callback = Mock(return_value=None)
+    controller.subscribe(callback)
+
+    resource_id = str(uuid4())
+    timeslot = {
+        "start_time": {"kind": "time", "time": {"hour": 7, "minute": 0, "second": 0}},
+        "target": {"rid": str(uuid4()), "rtype": "scene"},
+    }
+    evt_data = {
+        "id": resource_id,
+        "type": "smart_scene",
+        "metadata": {"name": "Natural light"},
+        "group": {"rid": str(uuid4()), "rtype": "room"},
+        "week_timeslots": [{"timeslots": [timeslot], "recurrence": ["monday"]}],
+        "state": "inactive",
+    }
+    # pylint: disable=protected-access
+    await controller._handle_event(EventType.RESOURCE_ADDED, evt_data)
+    callback.assert_called_once()
+    callback.reset_mock()
+
+    # update with an out of range time value
+    timeslot["start_time"]["time"]["minute"] = 60
+    evt_data = {"id": resource_id, "week_timeslots": evt_data["week_timeslots"]}
+    # pylint: disable=protected-access
+    await controller._handle_event(EventType.RESOURCE_UPDATED, evt_data)
+    callback.assert_not_called()
+    assert (
+        controller[resource_id].week_timeslots[0].timeslots[0].start_time.time.minute
+        == 0
+    )
+
+    # valid updates are still processed
+    evt_data = {"id": resource_id, "state": "active"}
+    # pylint: disable=protected-access
+    await controller._handle_event(EventType.RESOURCE_UPDATED, evt_data)
+    callback.assert_called_once()
+
+    # controllers that do not allow parser errors raise
+    controller.allow_parser_error = False
+    evt_data["week_timeslots"] = [{"timeslots": [timeslot], "recurrence": ["monday"]}]
+    with pytest.raises(ValueError, match="Minute"):
+        # pylint: disable=protected-access
+        await controller._handle_event(EventType.RESOURCE_UPDATED, evt_data)
+
+
+async def test_handle_invalid_update_event_unchanged():
+    """Test an update event that can't be parsed leaves the resource untouched."""
+    bridge = HueBridgeV2("127.0.0.1", "fake")
+    controller = RoomController(bridge)
+    callback = Mock(return_value=None)
+    controller.subscribe(callback)
+
+    resource_id = str(uuid4())
+    grouped_light_id = str(uuid4())
+    evt_data = {
+        "id": resource_id,
+        "type": "room",
+        "services": [{"rid": grouped_light_id, "rtype": "grouped_light"}],
+        "metadata": {"archetype": "kitchen", "name": "Kitchen"},
+        "children": [],
+    }
+    # pylint: disable=protected-access
+    await controller._handle_event(EventType.RESOURCE_ADDED, evt_data)
+    callback.reset_mock()
+
+    # valid services change followed by an invalid metadata value
+    evt_data = {
+        "id": resource_id,
+        "services": [{"rid": str(uuid4()), "rtype": "grouped_light"}],
+        "metadata": {"name": 5},
+    }
+    # pylint: disable=protected-access
+    await controller._handle_event(EventType.RESOURCE_UPDATED, evt_data)
+    callback.assert_not_called()
+    room = controller[resource_id]
+    assert room.services[0].rid == grouped_light_id
+    assert room.grouped_light == grouped_light_id
+    assert room.metadata.name == "Kitchen"
@@ -1,11 +1,39 @@
 """Test parser functions that converts the incoming json from API into dataclass models."""
 
-import datetime
 from dataclasses import dataclass
+import datetime
+import sys
+from uuid import uuid4
 
 import pytest
 
-from aiohue.util import dataclass_from_dict
+from aiohue.util import (
+    _parse_unknown_enum,
+    dataclass_from_dict,
+    dataclass_to_dict,
+    parse_enum,
+    update_dataclass,
+)
+from aiohue.v2.models.device import Device
+from aiohue.v2.models.feature import (
+    ColorTemperatureFeature,
+    DeltaAction,
+    DimmingDeltaFeaturePut,
+    MirekSchema,
+    Signal,
+    SignalingFeature,
+)
+from aiohue.v2.models.resource import ResourceIdentifier, ResourceTypes
+from aiohue.v2.models.room import Room, RoomArchetype
+from aiohue.v2.models.smart_scene import (
+    SmartScenePut,
+    SmartSceneRecall,
+    SmartSceneRecallAction,
+    SmartSceneTimeslot,
+    TimeslotStartTimeTime,
+)
+from aiohue.v2.models.temperature import Temperature
+from aiohue.v2.models.zone import Zone
 
 
 @dataclass
@@ -76,3 +104,240 @@ def test_dataclass_from_dict():
     # test extra keys not silently ignored in strict mode
     with pytest.raises(KeyError):
         dataclass_from_dict(BasicModel, raw2, strict=True)
+
+
+def test_parse_enum():
+    """Test Enum values are parsed, including fallback on unknown values."""
+    assert parse_enum(ResourceTypes, "light") is ResourceTypes.LIGHT
+    # unknown value should fallback to the `_missing_` default of the Enum
+    assert parse_enum(ResourceTypes, "non_existing") is ResourceTypes.UNKNOWN
+    # the default for the unknown value is now served from the (bounded) cache
+    assert parse_enum(ResourceTypes, "non_existing") is ResourceTypes.UNKNOWN
+    for idx in range(1000):
+        assert parse_enum(ResourceTypes, f"unknown_{idx}") is ResourceTypes.UNKNOWN
+    cache_info = _parse_unknown_enum.cache_info()
+    assert cache_info.currsize <= cache_info.maxsize
+    # unknown value on Enum without a default should raise
+    with pytest.raises(ValueError, match="is not a valid DeltaAction"):
+        parse_enum(DeltaAction, "non_existing")
+
+
+def test_mirek_schema_correction():
+    """Test invalid values in MirekSchema get corrected."""
+    raw = {
+        "mirek": 300,
+        "mirek_valid": True,
+        "mirek_schema": {"mirek_minimum": 0, "mirek_maximum": 65535},
+    }
+    res = dataclass_from_dict(ColorTemperatureFeature, raw)
+    assert res.mirek_schema.mirek_minimum == 153
+    assert res.mirek_schema.mirek_maximum == 500
+    raw["mirek_schema"] = {"mirek_minimum": 200, "mirek_maximum": 454}
+    res = dataclass_from_dict(ColorTemperatureFeature, raw)
+    assert res.mirek_schema.mirek_minimum == 200
+    assert res.mirek_schema.mirek_maximum == 454
+    # invalid values received in an update event get corrected too
+    update_dataclass(
+        res, {"mirek_schema": {"mirek_minimum": 0, "mirek_maximum": 65535}}
+    )
+    assert res.mirek_schema == MirekSchema(153, 500)
+    assert MirekSchema(mirek_minimum=0) == MirekSchema()
+
+
+def test_identifiers_interned():
+    """Test (resource) identifiers get interned when parsed."""
+    rid = str(uuid4())
+    res = dataclass_from_dict(ResourceIdentifier, {"rid": rid, "rtype": "light"})
+    assert res.rid == rid
+    assert res.rid is sys.intern(rid)
+    # nested identifiers are shared between resources
+    raw = {
+        "owner": {"rid": rid, "rtype": "device"},
+        "enabled": True,
+        "temperature": {"temperature": 21.5, "temperature_valid": True},
+    }
+    temp1 = dataclass_from_dict(Temperature, {"id": str(uuid4()), **raw})
+    temp2 = dataclass_from_dict(Temperature, {"id": str(uuid4()), **raw})
+    assert temp1.owner is temp2.owner
+    assert temp1.owner.rtype is ResourceTypes.DEVICE
+
+
+def test_update_dataclass_derived_fields():
+    """Test derived fields get recalculated when the source fields are updated."""
+    light_id = str(uuid4())
+    raw = {
+        "id": str(uuid4()),
+        "services": [{"rid": light_id, "rtype": "light"}],
+        "product_data": {
+            "model_id": "LCT001",
+            "manufacturer_name": "Signify Netherlands B.V.",
+            "product_name": "Hue color lamp",
+            "product_archetype": "sultan_bulb",
+            "certified": True,
+            "software_version": "1.88.1",
+        },
+        "metadata": {"archetype": "sultan_bulb", "name": "Hue color lamp 1"},
+    }
+    device = dataclass_from_dict(Device, raw)
+    assert device.lights == {light_id}
+    assert len(device.sensors) == 0
+    motion_id = str(uuid4())
+    changed = update_dataclass(
+        device,
+        {
+            "services": [
+                {"rid": light_id, "rtype": "light"},
+                {"rid": motion_id, "rtype": "motion"},
+            ]
+        },
+    )
+    assert changed == {"services"}
+    assert device.lights == {light_id}
+    assert device.sensors == {motion_id}
+    # derived fields should not end up in the api model
+    assert "_lights" not in dataclass_to_dict(device)
+    # an invalid update is rejected as a whole, derived fields stay consistent
+    with pytest.raises(TypeError):
+        update_dataclass(
+            device,
+            {
+                "services": [{"rid": str(uuid4()), "rtype": "light"}],
+                "product_data": {"certified": "notabool"},
+            },
+        )
+    assert len(device.services) == 2
+    assert device.lights == {light_id}
+    assert device.product_data.certified is True
+
+
+def test_update_dataclass_frozen_submodel():
+    """Test immutable sub models get replaced as a whole when updated."""
+    raw = {
+        "id": str(uuid4()),
+        "owner": {"rid": str(uuid4()), "rtype": "device"},
+        "enabled": True,
+        "temperature": {"temperature": 21.5, "temperature_valid": True},
+    }
+    temperature = dataclass_from_dict(Temperature, raw)
+    owner = temperature.owner
+    # identifiers are hashable
+    assert owner in {ResourceIdentifier(rid=owner.rid, rtype=ResourceTypes.DEVICE)}
+    assert update_dataclass(temperature, {"owner": raw["owner"]}) == set()
+    assert temperature.owner is owner
+    new_owner_id = str(uuid4())
+    changed = update_dataclass(
+        temperature, {"owner": {"rid": new_owner_id, "rtype": "device"}}
+    )
+    assert changed == {"owner"}
+    assert temperature.owner.rid == new_owner_id
+    # updated identifiers are the shared (cached) instances too
+    assert temperature.owner is ResourceIdentifier.from_dict(
+        {"rid": new_owner_id, "rtype": "device"}
+    )
+
+
+def test_update_dataclass_frozen_submodel_partial():
+    """Test partial updates of immutable sub models keep the other values."""
+    raw = {
+        "id": str(uuid4()),
+        "services": [],
+        "metadata": {"archetype": "kitchen", "name": "Kitchen"},
+        "children": [],
+    }
+    room = dataclass_from_dict(Room, raw)
+    changed = update_dataclass(room, {"metadata": {"name": "Cuisine"}})
+    assert changed == {"metadata"}
+    assert room.metadata.name == "Cuisine"
+    assert room.metadata.archetype is RoomArchetype.KITCHEN
+
+
+def test_room_derived_fields():
+    """Test the devices and grouped light of a room follow updates."""
+    device_id = str(uuid4())
+    grouped_light_id = str(uuid4())
+    raw = {
+        "id": str(uuid4()),
+        "services": [{"rid": grouped_light_id, "rtype": "grouped_light"}],
+        "metadata": {"archetype": "kitchen", "name": "Kitchen"},
+        "children": [{"rid": device_id, "rtype": "device"}],
+    }
+    room = dataclass_from_dict(Room, raw)
+    assert room.devices == {device_id}
+    assert room.grouped_light == grouped_light_id
+    update_dataclass(room, {"services": [], "children": []})
+    assert len(room.devices) == 0
+    assert room.grouped_light is None
+
+
+def test_zone_derived_fields():
+    """Test the lights and grouped light of a zone follow updates."""
+    light_id = str(uuid4())
+    grouped_light_id = str(uuid4())
+    raw = {
+        "id": str(uuid4()),
+        "services": [{"rid": grouped_light_id, "rtype": "grouped_light"}],
+        "metadata": {"archetype": "downstairs", "name": "Downstairs"},
+        "children": [{"rid": light_id, "rtype": "light"}],
+    }
+    zone = dataclass_from_dict(Zone, raw)
+    assert zone.lights == {light_id}
+    assert zone.grouped_light == grouped_light_id
+    update_dataclass(zone, {"children": []})
+    assert len(zone.lights) == 0
+
+
+def test_dataclass_to_dict():
+    """Test models are converted to plain (json serializable) dicts."""
+    put = DimmingDeltaFeaturePut(action=DeltaAction.UP, brightness_delta=10)
+    assert dataclass_to_dict(put) == {"action": "up", "brightness_delta": 10}
+    put = DimmingDeltaFeaturePut(action=DeltaAction.STOP)
+    assert dataclass_to_dict(put) == {"action": "stop"}
+    assert dataclass_to_dict(put, skip_none=False) == {
+        "action": "stop",
+        "brightness_delta": None,
+    }
+    # enums inside collections are converted too
+    feature = SignalingFeature(signal_values=(Signal.ON_OFF, Signal.ALTERNATING))
+    assert dataclass_to_dict(feature) == {"signal_values": ("on_off", "alternating")}
+    # the (constant) resource type is part of the api model
+    assert dataclass_to_dict(Zone(id="1", services=(), metadata=None, children=())) == {
+        "id": "1",
+        "services": (),
+        "children": (),
+        "type": "zone",
+    }
+
+
+def test_timeslot_time_ordering():
+    """Test timeslot start times sort chronologically."""
+    times = [
+        TimeslotStartTimeTime(hour=18, minute=0, second=0),
+        TimeslotStartTimeTime(hour=7, minute=30, second=0),
+        TimeslotStartTimeTime(hour=7, minute=5, second=59),
+    ]
+    assert sorted(times) == [times[2], times[1], times[0]]
+    assert times[1] < times[0]
+    with pytest.raises(ValueError, match="Hour"):
+        TimeslotStartTimeTime(hour=24, minute=0, second=0)
+
+
+def test_update_dataclass_nested_frozen_submodel():
+    """Test partial updates of nested immutable sub models."""
+    raw = {
+        "start_time": {"kind": "time", "time": {"hour": 7, "minute": 0, "second": 0}},
+        "target": {"rid": str(uuid4()), "rtype": "scene"},
+    }
+    timeslot = dataclass_from_dict(SmartSceneTimeslot, raw)
+    changed = update_dataclass(timeslot, {"start_time": {"time": {"hour": 8}}})
+    assert changed == {"start_time"}
+    assert timeslot.start_time.time == TimeslotStartTimeTime(8, 0, 0)
+    with pytest.raises(ValueError, match="Minute"):
+        update_dataclass(timeslot, {"start_time": {"time": {"minute": 60}}})
+
+
+def test_smart_scene_recall_to_dict():
+    """Test smart scene recall action is sent as its plain value."""
+    put = SmartScenePut(
+        recall=SmartSceneRecall(action=SmartSceneRecallAction.DEACTIVATE)
+    )
+    assert dataclass_to_dict(put) == {"recall": {"action": "deactivate"}}